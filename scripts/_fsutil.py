@@ -0,0 +1,150 @@
+"""
+Filesystem Helpers
+Shared file output utilities for the workflow scripts
+"""
+
+import functools
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+    import zstandard
+    COMPRESSION_AVAILABLE = True
+except ImportError:
+    COMPRESSION_AVAILABLE = False
+
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+# mkstemp creates files as 0600; read the umask once (it can only be read by
+# setting it) so outputs get the usual permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@functools.lru_cache(maxsize=128)
+def ensure_dir(path):
+    """
+    Create a directory (and parents) once per process
+    
+    Repeated calls for the same path are answered from the cache without
+    touching the filesystem, so batch runs don't stat the same output
+    directory for every file. A directory removed while the process runs
+    is recreated by write_atomic() on its next write there.
+    
+    Args:
+        path (str): Directory path
+    
+    Returns:
+        Path: The directory path
+    """
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def read_text_stripped(path):
+    """
+    Read a UTF-8 text file without surrounding whitespace
+    
+    The file is memory-mapped and only the stripped range is decoded, so a
+    large transcript is copied once (into the str) rather than read into a
+    bytes buffer, decoded, and copied again by str.strip().
+    
+    Args:
+        path (str): Path to the text file
+    
+    Returns:
+        str: File content with leading/trailing whitespace removed and
+            newlines normalized to \n
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = 0, len(mm)
+            while start < end and mm[start] in _ASCII_WHITESPACE:
+                start += 1
+            while end > start and mm[end - 1] in _ASCII_WHITESPACE:
+                end -= 1
+            with memoryview(mm) as view:
+                text = str(view[start:end], 'utf-8')
+    # Non-ASCII whitespace is rare enough to handle with a second pass
+    if text[:1].isspace() or text[-1:].isspace():
+        text = text.strip()
+    # Translate newlines like a text-mode read would
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def write_atomic(path, data):
+    """
+    Write a file in one call and move it into place atomically
+    
+    The data goes to a uniquely named temporary file next to the target
+    which then replaces it, so a crash never leaves a partially written
+    output and concurrent writers never share a temporary file.
+    
+    Args:
+        path (str): Destination file path
+        data (str or bytes): File content; str is encoded as UTF-8
+    
+    Returns:
+        str: Destination file path
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    directory = os.path.dirname(path) or "."
+    prefix = f".{os.path.basename(path)}."
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    except FileNotFoundError:
+        # The directory was removed after ensure_dir() cached it (e.g. during a
+        # long --persist run); forget the cached entries and create it again
+        ensure_dir.cache_clear()
+        ensure_dir(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return path
+
+
+def write_json_zst(path, obj, level=3):
+    """
+    Write an object as zstd-compressed JSON (atomically)
+    
+    Args:
+        path (str): Destination file path, conventionally ending in .json.zst
+        obj: JSON-serializable object (NumPy values are allowed)
+        level (int): zstd compression level
+    
+    Returns:
+        str: Destination file path
+    """
+    payload = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return write_atomic(path, zstandard.ZstdCompressor(level=level).compress(payload))
+
+
+def read_json_zst(path):
+    """
+    Read an object written by write_json_zst()
+    
+    Args:
+        path (str): Path to a .json.zst file
+    
+    Returns:
+        Decoded JSON object
+    """
+    return orjson.loads(zstandard.ZstdDecompressor().decompress(Path(path).read_bytes()))
@@ -0,0 +1,69 @@
+"""
+LLM Response Cache
+Persistent exact-match cache for model responses, keyed by a content hash
+"""
+
+import functools
+import hashlib
+import json
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+CACHE_DIR = "./.llm_cache"
+DEFAULT_EXPIRE = 86400  # seconds
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cache():
+    """Open the on-disk cache once per process (None if diskcache is missing)."""
+    if not DISKCACHE_AVAILABLE:
+        return None
+    return diskcache.Cache(CACHE_DIR)
+
+
+def cache_key(**params):
+    """
+    Build a cache key from the parameters that determine a response
+    
+    Args:
+        **params: JSON-serializable request parameters (model, messages, ...)
+    
+    Returns:
+        str: Hex digest identifying the request
+    """
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=32).hexdigest()
+
+
+def cache_get(key):
+    """
+    Look up a cached response
+    
+    Args:
+        key (str): Key from cache_key()
+    
+    Returns:
+        Cached value, or None on a miss or when caching is unavailable
+    """
+    cache = _get_cache()
+    if cache is None:
+        return None
+    return cache.get(key)
+
+
+def cache_set(key, value, expire=DEFAULT_EXPIRE):
+    """
+    Store a response in the cache
+    
+    Args:
+        key (str): Key from cache_key()
+        value: Response to store
+        expire (int): Time to live in seconds
+    """
+    cache = _get_cache()
+    if cache is not None:
+        cache.set(key, value, expire=expire)
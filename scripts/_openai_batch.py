@@ -0,0 +1,146 @@
+"""
+OpenAI Batch Helper
+Submits chat completion requests through the OpenAI Batch API and waits for the results
+"""
+
+import json
+import os
+import time
+
+from _fsutil import ensure_dir
+from _llm_cache import cache_get, cache_set
+from _openai_client import chat_cache_key, get_client
+
+BATCH_DIR = "./.openai_batch"
+POLL_INTERVAL = 30  # seconds
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def write_batch_file(bodies, batch_file):
+    """
+    Write chat completion request bodies as a Batch API input file
+    
+    Args:
+        bodies (dict): Mapping of custom_id to chat completion request body
+        batch_file (str): Path of the JSONL file to write
+    
+    Returns:
+        str: Path to the written file
+    """
+    with open(batch_file, 'w', encoding='utf-8') as f:
+        for custom_id, body in bodies.items():
+            request = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+    return batch_file
+
+
+def run_chat_batch(bodies, description="youtube-workflow", poll_interval=POLL_INTERVAL):
+    """
+    Run chat completion requests through the Batch API and collect the replies
+    
+    Blocks until the batch reaches a terminal status. Batches are billed at
+    a discount but may take up to 24 hours, so this is meant for offline runs.
+    
+    Args:
+        bodies (dict): Mapping of custom_id to chat completion request body
+        description (str): Label stored in the batch metadata
+        poll_interval (int): Seconds between status checks
+    
+    Returns:
+        dict: Mapping of custom_id to reply text (None for failed requests)
+    """
+    ensure_dir(BATCH_DIR)
+    batch_file = os.path.join(BATCH_DIR, f"{description}_{int(time.time())}.jsonl")
+    write_batch_file(bodies, batch_file)
+    
+    client = get_client()
+    with open(batch_file, 'rb') as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={"description": description},
+    )
+    print(f"Submitted batch {batch.id} with {len(bodies)} requests")
+    
+    while batch.status not in TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        print(f"Batch {batch.id}: {batch.status}")
+    
+    results = {custom_id: None for custom_id in bodies}
+    # Expired or cancelled batches may still have partial output
+    for record in _read_batch_records(client, batch.output_file_id):
+        response = record.get("response") or {}
+        if response.get("status_code") == 200:
+            message = response["body"]["choices"][0]["message"]["content"]
+            results[record["custom_id"]] = message.strip()
+        else:
+            print(f"Batch request {record['custom_id']} failed: {record.get('error')}")
+    # Requests rejected before reaching the model are only reported in the error file
+    for record in _read_batch_records(client, batch.error_file_id):
+        error = record.get("error") or (record.get("response") or {}).get("body", {}).get("error")
+        print(f"Batch request {record['custom_id']} failed: {error}")
+    
+    if batch.status != "completed":
+        print(f"Batch {batch.id} ended with status: {batch.status}")
+    # Input validation failures produce no output or error file, only batch.errors
+    for error in getattr(batch.errors, "data", None) or []:
+        location = f" (line {error.line})" if error.line else ""
+        print(f"Batch {batch.id} error{location}: {error.code}: {error.message}")
+    
+    return results
+
+
+def _read_batch_records(client, file_id):
+    """
+    Download a Batch API output or error file and parse its JSONL records
+    
+    Args:
+        client (openai.OpenAI): Client that owns the batch
+        file_id (str, optional): File ID from the batch (None yields nothing)
+    
+    Returns:
+        list: Parsed records
+    """
+    if not file_id:
+        return []
+    content = client.files.content(file_id).text
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def run_cached_chat_batch(bodies, description="youtube-workflow", poll_interval=POLL_INTERVAL):
+    """
+    Run chat completion requests through the Batch API, reusing cached replies
+    
+    Only requests missing from the LLM response cache are submitted, and
+    their replies are added to the cache.
+    
+    Args:
+        bodies (list): Chat completion request bodies
+        description (str): Label stored in the batch metadata
+        poll_interval (int): Seconds between status checks
+    
+    Returns:
+        list: Reply texts in input order (None for failed requests)
+    """
+    keys = [chat_cache_key(body) for body in bodies]
+    replies = [cache_get(key) for key in keys]
+    pending = {f"request-{i}": body for i, body in enumerate(bodies) if replies[i] is None}
+    
+    if pending:
+        results = run_chat_batch(pending, description, poll_interval)
+        for custom_id, reply in results.items():
+            i = int(custom_id.rsplit("-", 1)[1])
+            replies[i] = reply
+            if reply is not None:
+                cache_set(keys[i], reply)
+    
+    return replies
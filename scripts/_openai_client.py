@@ -0,0 +1,111 @@
+"""
+OpenAI Client Helper
+Shared OpenAI clients with pooled (HTTP/2 when available) connections
+
+Requests put their static system prompt first and the per-video text last
+so OpenAI's automatic prompt caching can reuse the prefix, and pass a
+prompt_cache_key (openai>=1.99) to keep similar requests on the same cache.
+Caching only applies to prompts of at least 1024 tokens on gpt-4o and newer
+models, so the system prompts are deliberately detailed and the scripts
+default to gpt-4o-mini.
+"""
+
+import asyncio
+import functools
+
+import httpx
+import openai
+
+from _llm_cache import cache_get, cache_key, cache_set
+
+HTTP_TIMEOUT = 60  # seconds
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+OPENAI_MAX_RETRIES = 5
+
+
+def _http2_available():
+    """Return True if the h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """
+    Get the process-wide synchronous OpenAI client
+    
+    Reusing one client keeps TLS connections alive across requests instead
+    of reconnecting for every call.
+    
+    Returns:
+        openai.OpenAI: Shared client
+    """
+    http_client = httpx.Client(http2=_http2_available(), timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+    return openai.OpenAI(http_client=http_client)
+
+
+def make_async_client():
+    """
+    Create an async OpenAI client with a pooled HTTP/2 connection
+    
+    Async connection pools are bound to the event loop they were opened in,
+    so create one client per asyncio.run() and share it across that run's
+    requests.
+    
+    Returns:
+        openai.AsyncOpenAI: New async client
+    """
+    http_client = httpx.AsyncClient(http2=_http2_available(), timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+    return openai.AsyncOpenAI(http_client=http_client)
+
+
+def chat_cache_key(body):
+    """
+    Build the response cache key for a chat completion request body
+    
+    prompt_cache_key only routes requests on OpenAI's side and does not
+    change the reply, so it is left out of the key.
+    
+    Args:
+        body (dict): Chat completion request body (model, messages, ...)
+    
+    Returns:
+        str: Key for the LLM response cache
+    """
+    return cache_key(**{name: value for name, value in body.items() if name != "prompt_cache_key"})
+
+
+async def chat_completion_cached(client, body, max_retries=OPENAI_MAX_RETRIES):
+    """
+    Run one chat completion with the async client, reusing cached replies
+    
+    Rate-limited requests are retried with exponential backoff.
+    
+    Args:
+        client (openai.AsyncOpenAI): Shared async client
+        body (dict): Chat completion request body (model, messages, ...)
+        max_retries (int): Attempts before a rate limit error is raised
+    
+    Returns:
+        str: Reply text
+    """
+    key = chat_cache_key(body)
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+    
+    for attempt in range(max_retries):
+        try:
+            response = await client.chat.completions.create(**body)
+            break
+        except openai.RateLimitError:
+            if attempt == max_retries - 1:
+                raise
+            await asyncio.sleep(2 ** attempt)
+    
+    reply = response.choices[0].message.content.strip()
+    cache_set(key, reply)
+    return reply
@@ -6,8 +6,11 @@ Downloads YouTube videos using yt-dlp
 
 import argparse
 import os
+import subprocess
 import sys
-from pathlib import Path
+import tempfile
+
+from _fsutil import ensure_dir
 
 try:
     import yt_dlp
@@ -15,6 +18,14 @@ except ImportError:
     print("Error: yt-dlp not installed. Run: pip install yt-dlp")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+PIPE_BUFFER_SIZE = 1 << 20
+
 
 def download_video(url, output_dir="./downloads", audio_only=False):
     """
@@ -29,12 +40,19 @@ def download_video(url, output_dir="./downloads", audio_only=False):
         str: Path to downloaded file
     """
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
     
     # Configure yt-dlp options
     ydl_opts = {
         'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
         'format': 'bestaudio/best' if audio_only else 'best[height<=720]',
+        # Fetch DASH/HLS fragments in parallel and use large read buffers
+        'concurrent_fragment_downloads': 8,
+        'buffersize': 1 << 20,
+        # Download plain HTTP formats in ranged chunks to sidestep throttling
+        'http_chunk_size': 10 << 20,
+        'retries': 10,
+        'fragment_retries': 10,
     }
     
     if audio_only:
@@ -42,15 +60,19 @@ def download_video(url, output_dir="./downloads", audio_only=False):
             'key': 'FFmpegExtractAudio',
             'preferredcodec': 'wav',
         }]
+        # Let ffmpeg use all available cores for the audio conversion
+        ydl_opts['postprocessor_args'] = {'ffmpegextractaudio': ['-threads', '0']}
     
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Get video info
-            info = ydl.extract_info(url, download=False)
+            # Extract info and download in one pass (a separate download()
+            # call would extract and decipher the video info again)
+            info = ydl.extract_info(url, download=True)
             filename = ydl.prepare_filename(info)
             
-            # Download the video
-            ydl.download([url])
+            # Postprocessors (e.g. audio extraction) change the final path
+            requested = info.get('requested_downloads') or [{}]
+            filename = requested[0].get('filepath', filename)
             print(f"Successfully downloaded: {filename}")
             return filename
             
@@ -59,6 +81,69 @@ def download_video(url, output_dir="./downloads", audio_only=False):
         return None
 
 
+def stream_audio(url, sample_rate=16000):
+    """
+    Stream a video's audio into memory without writing it to disk
+    
+    yt-dlp writes the best audio stream to stdout, ffmpeg resamples it to
+    mono 16-bit PCM on its stdout, and the samples are returned as floats
+    ready for Whisper. The title is printed by the same yt-dlp run, so the
+    video info is only extracted once.
+    
+    Args:
+        url (str): YouTube video URL
+        sample_rate (int): Output sample rate in Hz (Whisper expects 16000)
+    
+    Returns:
+        tuple: (numpy.ndarray of mono float32 samples in [-1, 1],
+            title made safe for file names, as download_video names its files)
+    
+    Raises:
+        ConnectionError: If yt-dlp or ffmpeg fails
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        title_file = os.path.join(tmp_dir, 'title.txt')
+        ytdlp = subprocess.Popen(
+            [sys.executable, '-m', 'yt_dlp', '--quiet', '-f', 'bestaudio/best',
+             '--print-to-file', '%(title)s', title_file, '-o', '-', url],
+            stdout=subprocess.PIPE,
+            bufsize=PIPE_BUFFER_SIZE,
+        )
+        ffmpeg = None
+        try:
+            ffmpeg = subprocess.Popen(
+                ['ffmpeg', '-loglevel', 'error', '-i', 'pipe:0',
+                 '-ar', str(sample_rate), '-ac', '1', '-f', 's16le', 'pipe:1'],
+                stdin=ytdlp.stdout,
+                stdout=subprocess.PIPE,
+                bufsize=PIPE_BUFFER_SIZE,
+            )
+            # Only ffmpeg holds the pipe now, so yt-dlp sees SIGPIPE if ffmpeg exits early
+            ytdlp.stdout.close()
+            raw, _ = ffmpeg.communicate()
+            ytdlp.wait()
+        finally:
+            # Don't leave a child running if ffmpeg failed to start or we were interrupted
+            ytdlp.stdout.close()
+            for proc in (ffmpeg, ytdlp):
+                if proc is not None and proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+        
+        if ytdlp.returncode != 0 or ffmpeg.returncode != 0:
+            raise ConnectionError(
+                f"Audio streaming failed (yt-dlp: {ytdlp.returncode}, ffmpeg: {ffmpeg.returncode})"
+            )
+        with open(title_file, 'r', encoding='utf-8') as f:
+            title = yt_dlp.utils.sanitize_filename(f.read().strip())
+    
+    samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    return samples, title
+
+
 def main():
     parser = argparse.ArgumentParser(description='Download YouTube videos')
     parser.add_argument('url', help='YouTube video URL')
@@ -5,9 +5,158 @@ to content generation and publication.
 """
 
 import argparse
+import bisect
+import functools
+import json
+import os
+import queue
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _fsutil import ensure_dir
+from download_video import download_video, stream_audio
+from generate_blog import blog_file_path, generate_blog
+from summarize_text import summarize_text
+from transcribe_audio import transcribe_audio
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+YOUTUBE_URL_PATTERN = (
+    r"^(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/watch\?v=|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?:[?&#].*)?$"
+)
+_YT_RE = re.compile(YOUTUBE_URL_PATTERN)
+
+DEFAULT_CONFIG = {
+    'model_size': 'base',
+    'backend': None,
+    'stream_audio': False,
+    'summary_method': 'transformers',
+    'max_length': 150,
+    'blog_method': 'template',
+    'queue_size': 2,
+}
+
+# Marks the end of the stream on a stage's input queue
+_DONE = object()
+
+
+class ProcessingError(Exception):
+    """Raised when a workflow step fails for a reason other than downloading."""
+
+
+def load_config(config_path):
+    """Load workflow configuration from a JSON file.
+    
+    Args:
+        config_path (str, optional): Path to a JSON configuration file
+    
+    Returns:
+        dict: DEFAULT_CONFIG updated with the values from the file
+    """
+    config = dict(DEFAULT_CONFIG)
+    if config_path:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config.update(json.load(f))
+    return config
+
+
+def download_and_transcribe(video_url, output_dir="./transcriptions", model_size="base", backend=None,
+                            name=None):
+    """Stream a video's audio straight into Whisper without a WAV file on disk.
+
+    Args:
+        video_url (str): YouTube video URL
+        output_dir (str): Output directory for transcriptions
+        model_size (str): Whisper model size
+        backend (str, optional): 'faster-whisper' or 'whisper'
+        name (str, optional): Base name for output files; defaults to the
+            video title, as used for downloaded files
+
+    Returns:
+        tuple: (transcription result with text and segments, base name of the output files)
+
+    Raises:
+        ValueError: If video_url is invalid
+        ConnectionError: If unable to stream the audio
+    """
+    if not validate_video_url(video_url):
+        raise ValueError(f"Invalid YouTube URL: {video_url}")
+    audio, title = stream_audio(video_url)
+    name = name or title
+    return transcribe_audio(audio, model_size, output_dir, backend=backend, name=name), name
+
+
+def _download_step(record, dirs, config):
+    """Download the audio track for record['url'] unless audio is streamed."""
+    if config['stream_audio']:
+        # The transcribe step streams the audio itself
+        return record
+    audio_file = download_video(record['url'], dirs['downloads'], audio_only=True)
+    if not audio_file:
+        raise ConnectionError(f"Unable to download video: {record['url']}")
+    record['audio_file'] = audio_file
+    record['title'] = Path(audio_file).stem
+    return record
+
+
+def _transcribe_step(record, dirs, config):
+    """Transcribe record['audio_file'] (or the streamed audio) with the configured backend."""
+    if config['stream_audio']:
+        result, record['title'] = download_and_transcribe(record['url'], dirs['transcriptions'],
+                                                          config['model_size'], config['backend'])
+    else:
+        result = transcribe_audio(record['audio_file'], config['model_size'], dirs['transcriptions'],
+                                  backend=config['backend'])
+    if not result:
+        raise ProcessingError(f"Transcription failed: {record['url']}")
+    record['transcript_file'] = os.path.join(
+        dirs['transcriptions'], f"{record['title']}_transcript.txt"
+    )
+    # Hand the text to the summarize step so it doesn't re-read the file
+    record['text'] = result['text']
+    return record
+
+
+def _summarize_step(record, dirs, config):
+    """Summarize the transcript text carried in the record with the configured method."""
+    transcript_file = record['transcript_file']
+    summary = summarize_text(transcript_file, dirs['summaries'],
+                             config['summary_method'], config['max_length'],
+                             text=record.pop('text'))
+    if not summary:
+        raise ProcessingError(f"Summarization failed: {transcript_file}")
+    record['summary_file'] = os.path.join(
+        dirs['summaries'], f"{Path(transcript_file).stem}_summary.txt"
+    )
+    return record
+
+
+def _blog_step(record, dirs, config):
+    """Generate a blog post from record['summary_file'], titled after the video."""
+    title = record['title']
+    blog_content = generate_blog(record['summary_file'], dirs['blogs'], title,
+                                 config['blog_method'], record['url'])
+    if not blog_content:
+        raise ProcessingError(f"Blog generation failed: {record['summary_file']}")
+    record['blog_file'] = blog_file_path(record['summary_file'], dirs['blogs'], title)
+    return record
+
+
+WORKFLOW_STEPS = (
+    ('download', _download_step),
+    ('transcribe', _transcribe_step),
+    ('summarize', _summarize_step),
+    ('blog', _blog_step),
+)
+
 
 def process_video(video_url, output_dir=None, config=None):
     """Main function to process a YouTube video through the entire workflow.
@@ -16,16 +165,121 @@ def process_video(video_url, output_dir=None, config=None):
         video_url (str): YouTube video URL to process
         output_dir (str, optional): Directory to save output files
         config (dict, optional): Configuration parameters
-        
+    
     Returns:
         dict: Results dictionary with paths to generated content
-        
+    
     Raises:
         ValueError: If video_url is invalid
         ConnectionError: If unable to download video
         ProcessingError: If any step in the workflow fails
     """
-    pass
+    if not validate_video_url(video_url):
+        raise ValueError(f"Invalid YouTube URL: {video_url}")
+    
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    dirs = setup_output_directories(output_dir or './output')
+    
+    record = {'url': video_url}
+    for _name, step in WORKFLOW_STEPS:
+        record = step(record, dirs, config)
+    return record
+
+
+def _run_stage(step, inbox, outbox, failures, workers=1):
+    """Feed records from inbox through step, forwarding results to outbox.
+    
+    Args:
+        step (callable): Function taking a record and returning the updated record
+        inbox (queue.Queue): Records from the previous stage, ended by _DONE
+        outbox (queue.Queue): Records for the next stage; _DONE is sent when drained
+        failures (list): Records that failed, with an 'error' message added
+        workers (int): Number of records processed concurrently
+    """
+    # The executor's own work queue is unbounded, so only take a record off
+    # the inbox when a worker is free; otherwise the stage would drain its
+    # inbox at once and the bounded queues would apply no backpressure
+    slots = threading.BoundedSemaphore(workers)
+    
+    def _handle(record):
+        try:
+            outbox.put(step(record))
+        except Exception as e:
+            record['error'] = str(e)
+            failures.append(record)
+        finally:
+            slots.release()
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            slots.acquire()
+            record = inbox.get()
+            if record is _DONE:
+                slots.release()
+                break
+            pool.submit(_handle, record)
+    # Leaving the with-block waits for in-flight records before ending the stream
+    outbox.put(_DONE)
+
+
+def process_videos(video_urls, output_dir=None, config=None):
+    """Process several videos with the workflow steps running as a pipeline.
+    
+    Each step runs in its own thread connected by queues, so while one
+    video is being transcribed the next one is downloading and the
+    previous one is being summarized. The transcription step uses a single
+    worker so only one Whisper model is resident; OpenAI-backed steps use
+    several workers so their requests overlap.
+    
+    Args:
+        video_urls (list): YouTube video URLs to process
+        output_dir (str, optional): Directory to save output files
+        config (dict, optional): Configuration parameters
+    
+    Returns:
+        tuple: (list of results dictionaries, list of failed records with 'error')
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    dirs = setup_output_directories(output_dir or './output')
+    
+    failures = []
+    inbox = queue.Queue()
+    for url, valid in zip(video_urls, validate_many(video_urls)):
+        if valid:
+            inbox.put({'url': url})
+        else:
+            failures.append({'url': url, 'error': f"Invalid YouTube URL: {url}"})
+    inbox.put(_DONE)
+    
+    workers = {
+        'summarize': 8 if config['summary_method'] == 'openai' else 1,
+        'blog': 8 if config['blog_method'] == 'openai' else 1,
+    }
+    
+    threads = []
+    for name, step in WORKFLOW_STEPS:
+        outbox = queue.Queue(maxsize=config['queue_size'])
+        thread = threading.Thread(
+            target=_run_stage,
+            args=(functools.partial(step, dirs=dirs, config=config), inbox, outbox, failures,
+                  workers.get(name, 1)),
+            name=f"workflow-{name}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+        inbox = outbox
+    
+    results = []
+    while True:
+        record = inbox.get()
+        if record is _DONE:
+            break
+        results.append(record)
+    
+    for thread in threads:
+        thread.join()
+    return results, failures
 
 
 def validate_video_url(url):
@@ -33,11 +287,55 @@ def validate_video_url(url):
     
     Args:
         url (str): URL to validate
-        
+    
     Returns:
         bool: True if valid YouTube URL, False otherwise
     """
-    pass
+    return _YT_RE.match(url) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_hyperscan_db():
+    """Compile the URL pattern into a Hyperscan database once per process."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[YOUTUBE_URL_PATTERN.encode()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_MULTILINE],
+    )
+    return db
+
+
+def validate_many(urls):
+    """Validate a batch of URLs, e.g. every entry of a playlist.
+    
+    When Hyperscan is installed the URLs are joined into one buffer and
+    scanned in a single pass; otherwise each URL is matched in turn.
+    
+    Args:
+        urls (list): URLs to validate
+        
+    Returns:
+        list: True/False for each URL, in input order
+    """
+    if not HYPERSCAN_AVAILABLE or any('\n' in url for url in urls):
+        return [validate_video_url(url) for url in urls]
+    
+    encoded = [url.encode() for url in urls]
+    line_starts = []
+    offset = 0
+    for line in encoded:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    
+    valid = [False] * len(urls)
+    
+    def _on_match(_id, _start, end, _flags, _context):
+        valid[bisect.bisect_right(line_starts, end) - 1] = True
+    
+    _get_hyperscan_db().scan(b"\n".join(encoded), match_event_handler=_on_match)
+    return valid
 
 
 def setup_output_directories(base_dir):
@@ -45,11 +343,17 @@ def setup_output_directories(base_dir):
     
     Args:
         base_dir (str): Base directory path
-        
+    
     Returns:
         dict: Dictionary of created directory paths
     """
-    pass
+    dirs = {
+        name: os.path.join(base_dir, name)
+        for name in ('downloads', 'transcriptions', 'summaries', 'blogs')
+    }
+    for path in dirs.values():
+        ensure_dir(path)
+    return dirs
 
 
 def main():
@@ -61,28 +365,41 @@ def main():
         description='Process YouTube videos into multiple content formats'
     )
     parser.add_argument(
-        '--url', 
-        required=True, 
-        help='YouTube video URL to process'
+        '--url',
+        required=True,
+        nargs='+',
+        help='YouTube video URL(s) to process'
     )
     parser.add_argument(
-        '--output-dir', 
-        default='./output', 
+        '--output-dir',
+        default='./output',
         help='Output directory for generated content'
     )
     parser.add_argument(
-        '--config', 
+        '--config',
         help='Path to configuration file'
     )
     
     args = parser.parse_args()
     
     try:
-        results = process_video(
-            video_url=args.url,
-            output_dir=args.output_dir,
-            config=args.config
-        )
+        config = load_config(args.config)
+        if len(args.url) == 1:
+            results = process_video(
+                video_url=args.url[0],
+                output_dir=args.output_dir,
+                config=config
+            )
+        else:
+            results, failures = process_videos(
+                video_urls=args.url,
+                output_dir=args.output_dir,
+                config=config
+            )
+            for failure in failures:
+                print(f"Error processing {failure['url']}: {failure['error']}")
+            if failures:
+                sys.exit(1)
         print(f"Processing completed successfully: {results}")
     except Exception as e:
         print(f"Error processing video: {e}")
@@ -1,63 +1,220 @@
 #!/usr/bin/env python3
 """
 Audio Transcription Script
-Transcribes audio files using OpenAI Whisper
+Transcribes audio files using Whisper (faster-whisper when installed, else OpenAI Whisper)
 """
 
 import argparse
+import functools
+import glob
+import json
 import os
 import sys
 from pathlib import Path
 
+from _fsutil import COMPRESSION_AVAILABLE, ensure_dir, write_atomic, write_json_zst
+
 try:
     import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
+
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
 except ImportError:
-    print("Error: whisper not installed. Run: pip install openai-whisper")
+    FASTER_WHISPER_AVAILABLE = False
+
+if not (WHISPER_AVAILABLE or FASTER_WHISPER_AVAILABLE):
+    print("Error: whisper not installed. Run: pip install faster-whisper (or openai-whisper)")
     sys.exit(1)
 
+DEFAULT_BACKEND = "faster-whisper" if FASTER_WHISPER_AVAILABLE else "whisper"
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
-def transcribe_audio(audio_file, model_size="base", output_dir="./transcriptions"):
+@functools.lru_cache(maxsize=2)
+def _get_model(model_size):
     """
-    Transcribe audio file using OpenAI Whisper
+    Load a Whisper model once per process and reuse it on later calls
     
     Args:
-        audio_file (str): Path to audio file
         model_size (str): Whisper model size (tiny, base, small, medium, large)
+    
+    Returns:
+        whisper.model.Whisper: Loaded Whisper model
+    """
+    print(f"Loading Whisper model: {model_size}")
+    return whisper.load_model(model_size)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_faster_model(model_size, compute_type=None):
+    """
+    Load a faster-whisper (CTranslate2) model once per process
+    
+    Args:
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        compute_type (str, optional): CTranslate2 compute type; defaults to
+            float16 on CUDA and int8 on CPU
+    
+    Returns:
+        faster_whisper.WhisperModel: Loaded model
+    """
+    device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type is None:
+        compute_type = "float16" if device == "cuda" else "int8"
+    print(f"Loading faster-whisper model: {model_size} ({device}, {compute_type})")
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+def _segments_jsonl(segments):
+    """
+    Serialize segments as JSON Lines (one {start, end, text} object per line)
+    
+    Args:
+        segments (list): Segment dicts with start, end and text
+    
+    Returns:
+        bytes: UTF-8 encoded JSON Lines payload
+    """
+    rows = ({'start': s['start'], 'end': s['end'], 'text': s['text']} for s in segments)
+    if ORJSON_AVAILABLE:
+        lines = [orjson.dumps(row) for row in rows]
+    else:
+        lines = [json.dumps(row, ensure_ascii=False).encode('utf-8') for row in rows]
+    return b"\n".join(lines) + b"\n" if lines else b""
+
+
+def _save_transcription(base_name, result, output_dir, segments_format="txt"):
+    """
+    Write transcript and segment files for a transcription result
+    
+    Args:
+        base_name (str): Base name for the output files
+        result (dict): Transcription result with text and segments
         output_dir (str): Output directory for transcriptions
+        segments_format (str): 'txt' for "[start - end]: text" lines,
+            'jsonl' for one JSON object per segment, 'json.zst' for the
+            full result as zstd-compressed JSON
+    
+    Returns:
+        str: Path to the transcript file
+    """
+    transcript_file = os.path.join(output_dir, f"{base_name}_transcript.txt")
+    
+    write_atomic(transcript_file, result['text'])
+    
+    # Save detailed segments if available, built up front and written once
+    if segments_format == "json.zst":
+        segments_file = os.path.join(output_dir, f"{base_name}_transcript.json.zst")
+        write_json_zst(segments_file, result)
+    elif segments_format == "jsonl":
+        segments_file = os.path.join(output_dir, f"{base_name}_segments.jsonl")
+        write_atomic(segments_file, _segments_jsonl(result['segments']))
+    else:
+        segments_file = os.path.join(output_dir, f"{base_name}_segments.txt")
+        segments_text = "".join(
+            f"[{segment['start']:.2f} - {segment['end']:.2f}]: {segment['text']}\n"
+            for segment in result['segments']
+        )
+        write_atomic(segments_file, segments_text)
+    
+    print(f"Transcription saved to: {transcript_file}")
+    print(f"Segments saved to: {segments_file}")
+    return transcript_file
+
+
+def _transcribe_faster(model, audio_file):
+    """
+    Transcribe with faster-whisper using greedy decoding and VAD
+    
+    Voice activity detection skips silent stretches and beam_size=1 avoids
+    scoring several hypotheses per token, so less audio is decoded and
+    each token is cheaper.
+    
+    Args:
+        model (faster_whisper.WhisperModel): Loaded model
+        audio_file (str or numpy.ndarray): Path to audio file or 16 kHz samples
+    
+    Returns:
+        dict: Transcription result with text, segments and language
+    """
+    segments, info = model.transcribe(
+        audio_file,
+        beam_size=1,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
+    )
+    # Segments are generated lazily; decoding happens while iterating
+    segments = [
+        {'start': s.start, 'end': s.end, 'text': s.text}
+        for s in segments
+    ]
+    return {
+        'text': "".join(s['text'] for s in segments),
+        'segments': segments,
+        'language': info.language,
+    }
+
+
+def transcribe_audio(audio_file, model_size="base", output_dir="./transcriptions", segments_format="txt",
+                     backend=None, compute_type=None, name=None):
+    """
+    Transcribe audio file using Whisper
+    
+    Args:
+        audio_file (str or numpy.ndarray): Path to audio file, or decoded
+            16 kHz mono float32 samples
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        output_dir (str): Output directory for transcriptions
+        segments_format (str): Segments file format ('txt', 'jsonl' or 'json.zst')
+        backend (str, optional): 'faster-whisper' or 'whisper'; defaults to
+            faster-whisper when it is installed
+        compute_type (str, optional): CTranslate2 compute type for faster-whisper
+            (float16, int8_float16, int8, float32)
+        name (str, optional): Base name for output files; required when
+            audio_file is an array, defaults to the audio file name without
+            its extension
     
     Returns:
         dict: Transcription result with text and segments
+    
+    Raises:
+        ValueError: If audio_file is an array and no name is given
     """
+    if name is None:
+        if not isinstance(audio_file, str):
+            raise ValueError("name is required when audio_file is not a file path")
+        name = Path(audio_file).stem
+    
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    ensure_dir(output_dir)
     
-    # Load Whisper model
-    print(f"Loading Whisper model: {model_size}")
-    model = whisper.load_model(model_size)
+    # Load Whisper model (cached across calls in the same process)
+    backend = backend or DEFAULT_BACKEND
+    if backend == "faster-whisper":
+        model = _get_faster_model(model_size, compute_type)
+    else:
+        model = _get_model(model_size)
     
     try:
         # Transcribe audio
-        print(f"Transcribing: {audio_file}")
-        result = model.transcribe(audio_file)
+        print(f"Transcribing: {name}")
+        if backend == "faster-whisper":
+            result = _transcribe_faster(model, audio_file)
+        else:
+            result = model.transcribe(audio_file)
         
         # Save transcription to file
-        base_name = Path(audio_file).stem
-        transcript_file = os.path.join(output_dir, f"{base_name}_transcript.txt")
-        
-        with open(transcript_file, 'w', encoding='utf-8') as f:
-            f.write(result['text'])
-        
-        # Save detailed segments if available
-        segments_file = os.path.join(output_dir, f"{base_name}_segments.txt")
-        with open(segments_file, 'w', encoding='utf-8') as f:
-            for segment in result['segments']:
-                start_time = segment['start']
-                end_time = segment['end']
-                text = segment['text']
-                f.write(f"[{start_time:.2f} - {end_time:.2f}]: {text}\n")
-        
-        print(f"Transcription saved to: {transcript_file}")
-        print(f"Segments saved to: {segments_file}")
+        _save_transcription(name, result, output_dir, segments_format)
         
         return result
         
@@ -66,23 +223,104 @@ def transcribe_audio(audio_file, model_size="base", output_dir="./transcriptions
         return None
 
 
+def expand_audio_files(patterns):
+    """
+    Expand file paths and glob patterns into a list of audio files
+    
+    Args:
+        patterns (list): Audio file paths or glob patterns
+    
+    Returns:
+        list: Matching audio file paths, in the order given
+    """
+    audio_files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        audio_files.extend(matches)
+    return audio_files
+
+
+def transcribe_files(audio_files, model_size="base", output_dir="./transcriptions",
+                     backend=None, compute_type=None, segments_format="txt"):
+    """
+    Transcribe several audio files with a single loaded Whisper model
+    
+    Args:
+        audio_files (list): Paths to audio files
+        model_size (str): Whisper model size (tiny, base, small, medium, large)
+        output_dir (str): Output directory for transcriptions
+        backend (str, optional): 'faster-whisper' or 'whisper' (default: best installed)
+        compute_type (str, optional): CTranslate2 compute type for faster-whisper
+        segments_format (str): Segments file format ('txt', 'jsonl' or 'json.zst')
+    
+    Returns:
+        int: Number of files that failed to transcribe
+    """
+    failures = 0
+    for audio_file in audio_files:
+        if not os.path.exists(audio_file):
+            print(f"Error: Audio file not found: {audio_file}")
+            failures += 1
+        elif not transcribe_audio(audio_file, model_size, output_dir, segments_format,
+                                  backend, compute_type):
+            failures += 1
+    return failures
+
+
 def main():
     parser = argparse.ArgumentParser(description='Transcribe audio files using Whisper')
-    parser.add_argument('audio_file', help='Path to audio file')
+    parser.add_argument('audio_files', nargs='*',
+                       help='Paths or glob patterns of audio files')
     parser.add_argument('--model', '-m', default='base',
                        choices=['tiny', 'base', 'small', 'medium', 'large'],
                        help='Whisper model size (default: base)')
     parser.add_argument('--output', '-o', default='./transcriptions',
                        help='Output directory (default: ./transcriptions)')
+    parser.add_argument('--persist', '-p', action='store_true',
+                       help='Keep the model loaded and read more file paths from stdin')
+    parser.add_argument('--backend', '-b', default=DEFAULT_BACKEND,
+                       choices=['faster-whisper', 'whisper'],
+                       help=f'Transcription backend (default: {DEFAULT_BACKEND})')
+    parser.add_argument('--compute-type', '-c', default=None,
+                       choices=['float16', 'int8_float16', 'int8', 'float32'],
+                       help='faster-whisper compute type (default: float16 on GPU, int8 on CPU)')
+    parser.add_argument('--segments-format', '-s', default='txt',
+                       choices=['txt', 'jsonl', 'json.zst'],
+                       help='Segments file format; json.zst stores the full result compressed '
+                            '(default: txt)')
     
     args = parser.parse_args()
     
-    if not os.path.exists(args.audio_file):
-        print(f"Error: Audio file not found: {args.audio_file}")
+    if not args.audio_files and not args.persist:
+        parser.error('at least one audio file is required unless --persist is set')
+    
+    if args.segments_format == 'json.zst' and not COMPRESSION_AVAILABLE:
+        print("Error: orjson/zstandard not installed. Run: pip install orjson zstandard")
         sys.exit(1)
     
-    result = transcribe_audio(args.audio_file, args.model, args.output)
-    if not result:
+    if args.backend == 'faster-whisper' and not FASTER_WHISPER_AVAILABLE:
+        print("Error: faster-whisper not installed. Run: pip install faster-whisper")
+        sys.exit(1)
+    if args.backend == 'whisper' and not WHISPER_AVAILABLE:
+        print("Error: whisper not installed. Run: pip install openai-whisper")
+        sys.exit(1)
+    
+    failures = transcribe_files(expand_audio_files(args.audio_files), args.model, args.output,
+                                args.backend, args.compute_type, args.segments_format)
+    
+    if args.persist:
+        # Load the model up front so the first stdin request doesn't pay for it
+        if args.backend == 'faster-whisper':
+            _get_faster_model(args.model, args.compute_type)
+        else:
+            _get_model(args.model)
+        for line in sys.stdin:
+            audio_file = line.strip()
+            if audio_file:
+                failures += transcribe_files([audio_file], args.model, args.output,
+                                             args.backend, args.compute_type, args.segments_format)
+    
+    if failures:
         sys.exit(1)
 
 